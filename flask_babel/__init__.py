@@ -8,21 +8,33 @@
     :license: BSD, see LICENSE for more details.
 """
 
+import mmap
 import os
+import sys
 from dataclasses import dataclass
 from types import SimpleNamespace
 from datetime import datetime
 from contextlib import contextmanager
-from typing import List, Callable, Optional, Union
+from functools import lru_cache
+from gettext import GNUTranslations, c2py, find
+from struct import iter_unpack, unpack_from
+from typing import List, Callable, Optional, Tuple, Union
 
 from babel.support import Translations, NullTranslations
-from flask import current_app, g
+from flask import current_app
 from babel import dates, numbers, support, Locale
 from pytz import timezone, UTC
 from werkzeug.datastructures import ImmutableDict
 from werkzeug.utils import cached_property
 
-from flask_babel.speaklater import LazyString
+from flask_babel.speaklater import LazyCall, LazyString
+
+try:
+    from flask.globals import _cv_app
+except ImportError:  # Flask < 2.2
+    from flask import _app_ctx_stack
+
+    _cv_app = None
 
 
 @dataclass
@@ -40,9 +52,14 @@ class BabelConfiguration:
     locale_selector: Optional[Callable] = None
     timezone_selector: Optional[Callable] = None
 
+    #: The locales translations were found for, in directory order, or
+    #: `None` if the translation directories have not been scanned yet.
+    translation_locales: Optional[Tuple[Locale, ...]] = None
+
 
 def get_babel(app=None) -> "BabelConfiguration":
-    app = app or current_app
+    # Resolve the proxy once rather than on every attribute access below.
+    app = app or current_app._get_current_object()
     if not hasattr(app, "extensions"):
         app.extensions = {}
     return app.extensions["babel"]
@@ -99,6 +116,7 @@ class Babel:
         default_timezone="UTC",
         locale_selector=None,
         timezone_selector=None,
+        eager_load=False,
     ):
         """
         Initializes the Babel instance for use with this specific application.
@@ -115,6 +133,8 @@ class Babel:
                                 for a request
         :param timezone_selector: The function to use to select the
                                   timezone for a request
+        :param eager_load: Load the translations for every available locale
+                           now instead of on first use
         """
         if not hasattr(app, "extensions"):
             app.extensions = {}
@@ -122,13 +142,14 @@ class Babel:
         directories = app.config.get(
             "BABEL_TRANSLATION_DIRECTORIES", default_translation_directories
         ).split(";")
+        translation_directories = list(self._resolve_directories(directories, app))
 
         app.extensions["babel"] = BabelConfiguration(
             default_locale=app.config.get("BABEL_DEFAULT_LOCALE", default_locale),
             default_timezone=app.config.get("BABEL_DEFAULT_TIMEZONE", default_timezone),
             default_domain=app.config.get("BABEL_DOMAIN", default_domain),
             default_directories=directories,
-            translation_directories=list(self._resolve_directories(directories, app)),
+            translation_directories=translation_directories,
             instance=self,
             locale_selector=locale_selector,
             timezone_selector=timezone_selector,
@@ -169,6 +190,14 @@ class Babel:
                 npgettext=lambda c, s, p, n: get_translations().unpgettext(c, s, p, n),
             )
 
+        if app.config.get("BABEL_EAGER_LOAD", eager_load):
+            # Warm the translations cache so that the first request for each
+            # locale does not have to look up and parse catalogs.
+            with app.app_context():
+                for locale in self.list_translations():
+                    with force_locale(locale):
+                        get_translations()
+
     def list_translations(self):
         """Returns a list of all the locales translations exist for. The list
         returned will be filled with actual locale objects and not just strings.
@@ -180,24 +209,36 @@ class Babel:
 
         .. versionadded:: 0.6
         """
-        result = []
-
-        for dirname in get_babel().translation_directories:
-            if not os.path.isdir(dirname):
-                continue
-
-            for folder in os.listdir(dirname):
-                locale_dir = os.path.join(dirname, folder, "LC_MESSAGES")
-                if not os.path.isdir(locale_dir):
-                    continue
+        babel = get_babel()
+        if babel.translation_locales is None:
+            babel.translation_locales = self._scan_translations(
+                babel.translation_directories
+            )
 
-                if any(x.endswith(".mo") for x in os.listdir(locale_dir)):
-                    result.append(Locale.parse(folder))
+        result = list(babel.translation_locales)
 
         if self.default_locale not in result:
             result.append(self.default_locale)
         return result
 
+    def reload_translations(self):
+        """Forgets the locales found in the translation directories of the
+        current application, so they are scanned again on the next call to
+        :meth:`list_translations`, and drops the translations loaded so far.
+        Changed catalogs are picked up without restarting the server.  The
+        current context is refreshed as well, so the new catalogs are used
+        right away.
+
+        Only the default domain is reloaded.  Translations cached by other
+        :class:`Domain` instances have to be dropped by clearing their
+        ``cache``.
+
+        .. versionadded:: 4.1
+        """
+        get_babel().translation_locales = None
+        self.domain_instance.cache.clear()
+        refresh()
+
     @property
     def default_locale(self) -> Locale:
         """The default locale from the configuration as an instance of a
@@ -222,6 +263,25 @@ class Babel:
         """The message domain for the translations."""
         return Domain(domain=self.domain)
 
+    @staticmethod
+    def _scan_translations(directories: List[str]) -> Tuple[Locale, ...]:
+        """Returns the locales any of `directories` has a ``.mo`` file for."""
+        result = []
+
+        for dirname in directories:
+            if not os.path.isdir(dirname):
+                continue
+
+            for folder in os.listdir(dirname):
+                locale_dir = os.path.join(dirname, folder, "LC_MESSAGES")
+                if not os.path.isdir(locale_dir):
+                    continue
+
+                if any(x.endswith(".mo") for x in os.listdir(locale_dir)):
+                    result.append(Locale.parse(folder))
+
+        return tuple(result)
+
     @staticmethod
     def _resolve_directories(directories: List[str], app=None):
         for path in directories:
@@ -299,7 +359,12 @@ def refresh():
     return English text and a now German page.
     """
     ctx = _get_current_context()
-    for key in "babel_locale", "babel_tzinfo", "babel_translations":
+    for key in (
+        "babel_locale",
+        "babel_tzinfo",
+        "babel_translations",
+        "babel_lazy_epoch",
+    ):
         if hasattr(ctx, key):
             delattr(ctx, key)
 
@@ -327,13 +392,14 @@ def force_locale(locale):
         return
 
     orig_attrs = {}
-    for key in ("babel_translations", "babel_locale"):
+    for key in ("babel_translations", "babel_locale", "babel_lazy_epoch"):
         orig_attrs[key] = getattr(ctx, key, None)
 
     try:
         ctx.babel_locale = Locale.parse(locale)
         ctx.forced_babel_locale = ctx.babel_locale
         ctx.babel_translations = None
+        ctx.babel_lazy_epoch = None
         yield
     finally:
         if hasattr(ctx, "forced_babel_locale"):
@@ -544,6 +610,318 @@ def format_scientific(number, format=None) -> str:
     return numbers.format_scientific(number, format=format, locale=locale)
 
 
+def _slavic_plural(n):
+    if n % 10 == 1 and n % 100 != 11:
+        return 0
+    if 2 <= n % 10 <= 4 and (n % 100 < 10 or n % 100 >= 20):
+        return 1
+    return 2
+
+
+def _polish_plural(n):
+    if n == 1:
+        return 0
+    if 2 <= n % 10 <= 4 and (n % 100 < 10 or n % 100 >= 20):
+        return 1
+    return 2
+
+
+#: Hand-written selectors for the most common ``Plural-Forms`` expressions,
+#: keyed by the expression with all whitespace removed.  These skip the
+#: argument checks of the generic functions built by :func:`gettext.c2py`.
+_KNOWN_PLURALS = {
+    "0": lambda n: 0,
+    "n!=1": lambda n: int(n != 1),
+    "(n!=1)": lambda n: int(n != 1),
+    "n>1": lambda n: int(n > 1),
+    "(n>1)": lambda n: int(n > 1),
+    "n%10==1&&n%100!=11?0:n%10>=2&&n%10<=4&&(n%100<10||n%100>=20)?1:2": (
+        _slavic_plural
+    ),
+    "(n%10==1&&n%100!=11?0:n%10>=2&&n%10<=4&&(n%100<10||n%100>=20)?1:2)": (
+        _slavic_plural
+    ),
+    "n==1?0:n%10>=2&&n%10<=4&&(n%100<10||n%100>=20)?1:2": _polish_plural,
+    "(n==1?0:n%10>=2&&n%10<=4&&(n%100<10||n%100>=20)?1:2)": _polish_plural,
+}
+
+
+_missing = object()
+
+
+@lru_cache(maxsize=None)
+def _compile_plural(expression: str) -> Callable[[int], int]:
+    """Compiles a ``Plural-Forms`` expression into a callable returning the
+    index of the plural form to use.  Compiled expressions are cached, so all
+    catalogs sharing a plural rule share the same callable.
+    """
+    try:
+        return _KNOWN_PLURALS["".join(expression.split())]
+    except KeyError:
+        return c2py(expression)
+
+
+def _plural_expression(header: str) -> Optional[str]:
+    """Extracts the ``plural=`` expression from a ``Plural-Forms`` header."""
+    for part in header.split(";"):
+        key, _, value = part.partition("=")
+        if key.strip() == "plural":
+            return value.strip()
+    return None
+
+
+class CompiledTranslations(support.Translations):
+    """The translations catalog Flask-Babel merges the catalogs of all
+    translation directories into.
+
+    Unlike :meth:`babel.support.Translations.merge`, merging a catalog also
+    carries over its metadata and its plural rule, compiled only once per
+    distinct ``Plural-Forms`` expression.  Message ids are interned and
+    translations are deduplicated through `pool`, so catalogs for different
+    locales, or for variants of the same language, loaded with the same pool
+    share the storage of identical strings.
+    """
+
+    def __init__(self, fp=None, domain=None, pool=None):
+        # Unlike :func:`sys.intern`, which makes strings immortal on Python
+        # 3.12 and newer, a pool is freed together with its catalogs.
+        self._pool = {} if pool is None else pool
+        super().__init__(fp=fp, domain=domain)
+        self._compile_lookups()
+
+    @classmethod
+    def load(cls, dirname=None, locales=None, domain=None, pool=None):
+        """Loads the catalogs for the given locales and all of their parent
+        locales (``de`` for ``de_DE``) from `dirname`.  The catalogs are
+        merged into a single flat catalog, parents first, so that messages
+        missing from a regional catalog fall back to the language catalog
+        without walking a chain of fallbacks on every lookup.
+        """
+        if not domain:
+            domain = cls.DEFAULT_DOMAIN
+        if isinstance(locales, (str, Locale)):
+            locales = [locales]
+
+        translations = cls(domain=domain, pool=pool)
+        filenames = find(domain, dirname, [str(x) for x in locales or ()], all=True)
+        for filename in reversed(filenames):
+            # Every file is parsed straight into the same catalog, so there
+            # are no intermediate catalogs to build and copy over.
+            with open(filename, "rb") as fp:
+                translations._parse(fp)
+            translations.files.append(filename)
+        return translations
+
+    def _parse(self, fp):
+        """Parses a ``.mo`` file through a read-only memory map of `fp`, so
+        the file is never copied into memory as a whole.  File-like objects
+        that are not backed by a file, and empty files, are read instead.
+
+        Messages are added to the existing catalog, replacing messages with
+        the same identifier.
+        """
+        filename = getattr(fp, "name", "")
+        try:
+            fileno = fp.fileno()
+        except (AttributeError, OSError):
+            fileno = None
+
+        if fileno is None or os.fstat(fileno).st_size == 0:
+            self._parse_buffer(fp.read(), filename)
+        else:
+            with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as buf:
+                self._parse_buffer(buf, filename)
+
+        self._compile_lookups()
+
+    def _parse_buffer(self, buf, filename):
+        catalog = self._catalog
+        intern = sys.intern
+        pool = self._pool.setdefault
+        self._charset = None
+        buflen = len(buf)
+        if buflen < 20:
+            raise OSError(0, "File is corrupt", filename)
+
+        magic = unpack_from("<I", buf)[0]
+        if magic == self.LE_MAGIC:
+            version, msgcount, masteridx, transidx = unpack_from("<4I", buf, 4)
+            ii = "<II"
+        elif magic == self.BE_MAGIC:
+            version, msgcount, masteridx, transidx = unpack_from(">4I", buf, 4)
+            ii = ">II"
+        else:
+            raise OSError(0, "Bad magic number", filename)
+
+        major_version, minor_version = self._get_versions(version)
+        if major_version not in self.VERSIONS:
+            raise OSError(0, "Bad version number " + str(major_version), filename)
+
+        # Unpack both offset tables in one go rather than entry by entry.
+        masterend = masteridx + 8 * msgcount
+        transend = transidx + 8 * msgcount
+        if masterend > buflen or transend > buflen:
+            raise OSError(0, "File is corrupt", filename)
+        entries = zip(
+            iter_unpack(ii, buf[masteridx:masterend]),
+            iter_unpack(ii, buf[transidx:transend]),
+        )
+
+        for (mlen, moff), (tlen, toff) in entries:
+            mend = moff + mlen
+            tend = toff + tlen
+            if mend >= buflen or tend >= buflen:
+                raise OSError(0, "File is corrupt", filename)
+            msg = buf[moff:mend]
+            tmsg = buf[toff:tend]
+
+            if mlen == 0:
+                self._parse_info(tmsg)
+
+            charset = self._charset or "ascii"
+            if b"\x00" in msg:
+                # Plural forms
+                msgid1, _ = msg.split(b"\x00")
+                msgid1 = intern(str(msgid1, charset))
+                for index, form in enumerate(tmsg.split(b"\x00")):
+                    form = str(form, charset)
+                    catalog[msgid1, index] = pool(form, form)
+            else:
+                tmsg = str(tmsg, charset)
+                catalog[intern(str(msg, charset))] = pool(tmsg, tmsg)
+
+    def _parse_info(self, header):
+        """Parses the catalog metadata stored as the translation of the
+        empty message id.
+        """
+        last_key = None
+        for line in header.split(b"\n"):
+            item = line.decode().strip()
+            if not item:
+                continue
+            # Skip over comment lines
+            if item.startswith("#-#-#-#-#") and item.endswith("#-#-#-#-#"):
+                continue
+
+            if ":" not in item:
+                if last_key:
+                    self._info[last_key] += "\n" + item
+                continue
+
+            key, value = item.split(":", 1)
+            key = key.strip().lower()
+            value = value.strip()
+            self._info[key] = value
+            last_key = key
+
+            if key == "content-type":
+                self._charset = value.split("charset=")[1]
+            elif key == "plural-forms":
+                expression = _plural_expression(value)
+                if expression is not None:
+                    self.plural = _compile_plural(expression)
+
+    def merge(self, translations):
+        if not isinstance(translations, GNUTranslations):
+            return self
+
+        catalog = self._catalog
+        pool = self._pool.setdefault
+        for key, message in translations._catalog.items():
+            if isinstance(key, tuple):
+                key = (sys.intern(key[0]), key[1])
+            else:
+                key = sys.intern(key)
+            catalog[key] = pool(message, message)
+
+        if isinstance(translations, support.Translations):
+            self.files.extend(translations.files)
+
+        if translations.info():
+            self._info.update(translations.info())
+            expression = _plural_expression(self._info.get("plural-forms", ""))
+            if expression is not None:
+                self.plural = _compile_plural(expression)
+                self._compile_lookups()
+        return self
+
+    def add_fallback(self, fallback):
+        super().add_fallback(fallback)
+        self._compile_lookups()
+
+    def _compile_lookups(self):
+        """Binds :meth:`gettext` and :meth:`ngettext` to closures over the
+        catalog, the plural selector and the fallback, which avoids the
+        attribute lookups of the generic methods.  Anything replacing one of
+        those has to call this again.
+
+        The closures do not refer to `self`, so binding them does not create
+        a reference cycle and dropped catalogs are freed right away.
+        """
+        catalog = self._catalog
+        plural = self.plural
+        fallback = self._fallback
+
+        def gettext(message):
+            translated = catalog.get(message, _missing)
+            if translated is _missing:
+                translated = catalog.get((message, plural(1)), _missing)
+                if translated is _missing:
+                    if fallback:
+                        return fallback.gettext(message)
+                    return message
+            return translated
+
+        def ngettext(msgid1, msgid2, n):
+            try:
+                return catalog[msgid1, plural(n)]
+            except KeyError:
+                if fallback:
+                    return fallback.ngettext(msgid1, msgid2, n)
+                return msgid1 if n == 1 else msgid2
+
+        self.gettext = self.ugettext = gettext
+        self.ngettext = self.ungettext = ngettext
+
+
+class CachedLazyString(LazyString):
+    """A :class:`~flask_babel.speaklater.LazyString` for translations that
+    is evaluated at most once per request context.
+
+    Lazy translations are usually defined at module level and converted to a
+    string every time they are rendered.  The value is remembered together
+    with an epoch token stored on the current context, which is renewed for
+    every context and by :func:`refresh`, :func:`force_locale` and
+    :meth:`Domain.as_default`.  Until then the formatted value is returned
+    as is, even if the variables passed in have changed since.
+    """
+
+    __slots__ = ("_cache",)
+
+    def __init__(self, func, *args, **kwargs):
+        super().__init__(func, *args, **kwargs)
+        # A single (epoch, value) tuple, so that concurrent requests never
+        # observe the epoch of one request paired with the value of another.
+        self._cache = None
+
+    def __str__(self):
+        ctx = _get_current_context()
+        if ctx is None:
+            return super().__str__()
+
+        epoch = getattr(ctx, "babel_lazy_epoch", None)
+        if epoch is None:
+            epoch = ctx.babel_lazy_epoch = object()
+
+        cache = self._cache
+        if cache is not None and cache[0] is epoch:
+            return cache[1]
+
+        value = super().__str__()
+        self._cache = (epoch, value)
+        return value
+
+
 class Domain(object):
     """Localization domain. By default, it will look for translations in the
     Flask application directory and "messages" domain - all message catalogs
@@ -573,6 +951,7 @@ class Domain(object):
         self.domain = domain.split(";")
 
         self.cache = {}
+        self._string_pool = {}
 
     def __repr__(self):
         return "<Domain({!r}, {!r})>".format(self._translation_directories, self.domain)
@@ -591,6 +970,7 @@ class Domain(object):
             raise RuntimeError("No request context")
 
         ctx.babel_domain = self
+        ctx.babel_lazy_epoch = None
 
     def get_translations_cache(self, ctx):
         """Returns dictionary-like object for translation caching"""
@@ -602,28 +982,41 @@ class Domain(object):
         if ctx is None:
             return support.NullTranslations()
 
+        # The translations resolved for this context are remembered per
+        # domain, so repeated lookups skip the locale and cache key work.
+        # :func:`refresh` and :func:`force_locale` reset this mapping.
+        resolved = getattr(ctx, "babel_translations", None)
+        if resolved is None:
+            resolved = ctx.babel_translations = {}
+
+        try:
+            return resolved[self]
+        except KeyError:
+            pass
+
         cache = self.get_translations_cache(ctx)
         locale = get_locale()
         try:
-            return cache[str(locale), self.domain[0]]
+            translations = cache[str(locale), self.domain[0]]
         except KeyError:
-            translations = support.Translations()
+            # The strings shared between the cached catalogs are only kept
+            # while there are any, so clearing the cache releases them too.
+            if not cache:
+                self._string_pool = {}
+            pool = self._string_pool
+            translations = CompiledTranslations(pool=pool)
 
             for index, dirname in enumerate(self.translation_directories):
 
                 domain = self.domain[0] if len(self.domain) == 1 else self.domain[index]
 
-                catalog = support.Translations.load(dirname, [locale], domain)
+                catalog = CompiledTranslations.load(dirname, [locale], domain, pool)
                 translations.merge(catalog)
-                # FIXME: Workaround for merge() being really, really stupid. It
-                # does not copy _info, plural(), or any other instance variables
-                # populated by GNUTranslations. We probably want to stop using
-                # `support.Translations.merge` entirely.
-                if catalog.info() and hasattr(catalog, "plural"):
-                    translations.plural = catalog.plural
 
             cache[str(locale), self.domain[0]] = translations
-            return translations
+
+        resolved[self] = translations
+        return translations
 
     def gettext(self, string, **variables):
         """Translates a string with the current locale and passes in the
@@ -638,6 +1031,20 @@ class Domain(object):
         s = t.ugettext(string)
         return s if not variables else s % variables
 
+    def gettext_many(self, strings):
+        """Translates several strings with the current locale at once.  The
+        translations are looked up only once for the whole batch.  No
+        formatting is applied to the returned strings.
+
+        ::
+
+            title, subtitle = gettext_many((u'Welcome', u'Please log in'))
+
+        .. versionadded:: 4.1
+        """
+        translate = self.get_translations().ugettext
+        return tuple(translate(string) for string in strings)
+
     def ngettext(self, singular, plural, num, **variables):
         """Translates a string with the current locale and passes in the
         given keyword arguments as mapping to a string formatting string.
@@ -653,7 +1060,7 @@ class Domain(object):
         variables.setdefault("num", num)
         t = self.get_translations()
         s = t.ungettext(singular, plural, num)
-        return s if not variables else s % variables
+        return s % variables
 
     def pgettext(self, context, string, **variables):
         """Like :func:`gettext` but with a context.
@@ -672,7 +1079,7 @@ class Domain(object):
         variables.setdefault("num", num)
         t = self.get_translations()
         s = t.unpgettext(context, singular, plural, num)
-        return s if not variables else s % variables
+        return s % variables
 
     def lazy_gettext(self, string, **variables):
         """Like :func:`gettext` but the string returned is lazy which means
@@ -685,8 +1092,18 @@ class Domain(object):
             @app.route('/')
             def index():
                 return unicode(hello)
+
+        The translated and formatted string is cached for the rest of the
+        request, variables included, so later changes to the variables are
+        not picked up until :func:`refresh` is called.  Wrap variables that
+        should only be computed when the string is used in
+        :func:`lazy_call`.
+
+        .. versionchanged:: 4.1
+           The result is cached per request instead of being evaluated on
+           every use.
         """
-        return LazyString(self.gettext, string, **variables)
+        return CachedLazyString(self.gettext, string, **variables)
 
     def lazy_ngettext(self, singular, plural, num, **variables):
         """Like :func:`ngettext` but the string returned is lazy which means
@@ -703,8 +1120,16 @@ class Domain(object):
             @app.route('/')
             def index():
                 return unicode(apples)
+
+        As with :meth:`lazy_gettext`, the result, including `num` and the
+        other variables, is cached until the request ends or
+        :func:`refresh` is called.
+
+        .. versionchanged:: 4.1
+           The result is cached per request instead of being evaluated on
+           every use.
         """
-        return LazyString(self.ngettext, singular, plural, num, **variables)
+        return CachedLazyString(self.ngettext, singular, plural, num, **variables)
 
     def lazy_pgettext(self, context, string, **variables):
         """Like :func:`pgettext` but the string returned is lazy which means
@@ -712,17 +1137,25 @@ class Domain(object):
 
         .. versionadded:: 0.7
         """
-        return LazyString(self.pgettext, context, string, **variables)
+        return CachedLazyString(self.pgettext, context, string, **variables)
 
 
 def _get_current_context() -> Optional[SimpleNamespace]:
-    if not g:
+    # This runs several times for every translated string, so read the
+    # application context directly instead of going through the `g` proxy.
+    if _cv_app is not None:
+        app_ctx = _cv_app.get(None)
+    else:
+        app_ctx = _app_ctx_stack.top
+
+    if app_ctx is None:
         return None
 
-    if not hasattr(g, "_flask_babel"):
-        g._flask_babel = SimpleNamespace()
-
-    return g._flask_babel  # noqa
+    try:
+        return app_ctx.g._flask_babel
+    except AttributeError:
+        app_ctx.g._flask_babel = ctx = SimpleNamespace()
+        return ctx
 
 
 def get_domain() -> Domain:
@@ -748,6 +1181,10 @@ def gettext(*args, **kwargs) -> str:
 _ = gettext
 
 
+def gettext_many(*args, **kwargs) -> Tuple[str, ...]:
+    return get_domain().gettext_many(*args, **kwargs)
+
+
 def ngettext(*args, **kwargs) -> str:
     return get_domain().ngettext(*args, **kwargs)
 
@@ -761,16 +1198,35 @@ def npgettext(*args, **kwargs) -> str:
 
 
 def lazy_gettext(*args, **kwargs) -> LazyString:
-    return LazyString(gettext, *args, **kwargs)
+    return CachedLazyString(gettext, *args, **kwargs)
 
 
 def lazy_pgettext(*args, **kwargs) -> LazyString:
-    return LazyString(pgettext, *args, **kwargs)
+    return CachedLazyString(pgettext, *args, **kwargs)
 
 
 def lazy_ngettext(*args, **kwargs) -> LazyString:
-    return LazyString(ngettext, *args, **kwargs)
+    return CachedLazyString(ngettext, *args, **kwargs)
 
 
 def lazy_npgettext(*args, **kwargs) -> LazyString:
-    return LazyString(npgettext, *args, **kwargs)
+    return CachedLazyString(npgettext, *args, **kwargs)
+
+
+def lazy_call(func: Callable) -> LazyCall:
+    """Defers computing an argument of a lazy string until the string is
+    actually used, which is useful when the argument is expensive and the
+    string might never be rendered::
+
+        apples = lazy_ngettext(
+            u'%(num)d Apple',
+            u'%(num)d Apples',
+            lazy_call(count_apples),
+        )
+
+    `func` is called without arguments every time the string is evaluated,
+    which happens at most once per request.
+
+    .. versionadded:: 4.1
+    """
+    return LazyCall(func)
@@ -1,11 +1,50 @@
+class LazyCall(object):
+    """Marks an argument of a :class:`LazyString` that is only computed, by
+    calling `func`, when the string is evaluated.
+    """
+
+    __slots__ = ("func",)
+
+    def __init__(self, func):
+        self.func = func
+
+    def __getstate__(self):
+        return {"func": self.func}
+
+    def __setstate__(self, state):
+        self.func = state["func"]
+
+    def __repr__(self):
+        return "LazyCall({0!r})".format(self.func)
+
+
+def _resolve(value):
+    return value.func() if isinstance(value, LazyCall) else value
+
+
 class LazyString(object):
+    __slots__ = ("_func", "_args", "_kwargs", "_deferred", "__weakref__")
+
     def __init__(self, func, *args, **kwargs):
         self._func = func
         self._args = args
         self._kwargs = kwargs
+        self._deferred = any(
+            isinstance(x, LazyCall) for x in args + tuple(kwargs.values())
+        )
+
+    def __getstate__(self):
+        return {"_func": self._func, "_args": self._args, "_kwargs": self._kwargs}
+
+    def __setstate__(self, state):
+        # The same keys as the __dict__ of lazy strings pickled before
+        # LazyString used __slots__, so those still load.
+        self.__init__(state["_func"], *state["_args"], **state["_kwargs"])
 
     def __getattr__(self, attr):
-        if attr == "__setstate__":
+        # Private and special names are never looked up on the string, so
+        # an unset slot cannot recurse into str(self).
+        if attr.startswith("_"):
             raise AttributeError(attr)
 
         string = str(self)
@@ -18,7 +57,14 @@ class LazyString(object):
         return "l'{0}'".format(str(self))
 
     def __str__(self):
-        return str(self._func(*self._args, **self._kwargs))
+        # Lazy strings restored without a `_deferred` slot resolve their
+        # arguments, which is always correct.
+        if not getattr(self, "_deferred", True):
+            return str(self._func(*self._args, **self._kwargs))
+
+        args = [_resolve(x) for x in self._args]
+        kwargs = {k: _resolve(v) for k, v in self._kwargs.items()}
+        return str(self._func(*args, **kwargs))
 
     def __len__(self):
         return len(str(self))
@@ -1,7 +1,17 @@
+import glob
+import io
+import os
+import pickle
+import shutil
+import weakref
+from gettext import GNUTranslations, c2py
+
 import flask
+import pytest
 
 import flask_babel as babel
 from flask_babel import gettext, lazy_gettext, lazy_ngettext, ngettext, get_babel
+from flask_babel.speaklater import LazyString
 
 
 def test_basics():
@@ -169,7 +179,8 @@ def test_multiple_apps():
 
 def test_cache(mocker):
     load_mock = mocker.patch(
-        "babel.support.Translations.load", side_effect=babel.support.Translations.load
+        "flask_babel.CompiledTranslations.load",
+        side_effect=babel.CompiledTranslations.load,
     )
 
     app = flask.Flask(__name__)
@@ -278,3 +289,374 @@ def test_plurals_different_domains():
 
         assert ngettext("%(num)s Apple", "%(num)s Apples", 1) == "リンゴ 1 個"
         assert ngettext("%(num)s Apple", "%(num)s Apples", 2) == "リンゴ 2 個"
+
+
+def test_plurals_shared_between_catalogs():
+    app1 = flask.Flask(__name__)
+    babel.Babel(app1, default_locale="de_DE")
+
+    app2 = flask.Flask(__name__)
+    babel.Babel(app2, default_locale="de_DE")
+
+    with app1.test_request_context():
+        first = babel.get_translations()
+
+    with app2.test_request_context():
+        second = babel.get_translations()
+
+    assert first is not second
+    assert first.plural is second.plural
+    assert first.info()["plural-forms"] == "nplurals=2; plural=(n != 1)"
+
+
+def test_refresh_translations():
+    app = flask.Flask(__name__)
+    babel.Babel(app, locale_selector=lambda: the_locale)
+
+    the_locale = "de_DE"
+    with app.test_request_context():
+        assert gettext("Yes") == "Ja"
+
+        the_locale = "en_US"
+        assert gettext("Yes") == "Ja"
+
+        babel.refresh()
+        assert gettext("Yes") == "Yes"
+
+        with babel.force_locale("de_DE"):
+            assert gettext("Yes") == "Ja"
+
+        assert gettext("Yes") == "Yes"
+
+
+def test_lazy_gettext_cached_per_context(mocker):
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de_DE")
+    domain = babel.Domain()
+    spy = mocker.spy(domain, "gettext")
+    yes = domain.lazy_gettext("Yes")
+
+    with app.test_request_context():
+        assert str(yes) == "Ja"
+        assert yes.__html__() == "Ja"
+        assert spy.call_count == 1
+
+        with babel.force_locale("en_US"):
+            assert str(yes) == "Yes"
+        assert spy.call_count == 2
+
+        assert str(yes) == "Ja"
+        assert spy.call_count == 3
+
+    with app.test_request_context():
+        assert str(yes) == "Ja"
+        assert spy.call_count == 4
+
+
+def test_eager_load(mocker):
+    load_mock = mocker.patch(
+        "flask_babel.CompiledTranslations.load",
+        side_effect=babel.CompiledTranslations.load,
+    )
+
+    app = flask.Flask(__name__)
+    app.config["BABEL_EAGER_LOAD"] = True
+    b = babel.Babel(app, default_locale="de_DE")
+
+    assert load_mock.call_count == 3
+    assert set(b.domain_instance.cache) == {
+        ("de", "messages"),
+        ("ja", "messages"),
+        ("de_DE", "messages"),
+    }
+
+    with app.test_request_context():
+        assert babel.gettext("Yes") == "Ja"
+    assert load_mock.call_count == 3
+
+
+def test_catalogs_share_strings():
+    app = flask.Flask(__name__)
+    babel.Babel(app, locale_selector=lambda: the_locale)
+
+    the_locale = "de"
+    with app.test_request_context():
+        de = babel.get_translations()
+
+    the_locale = "de_DE"
+    with app.test_request_context():
+        de_de = babel.get_translations()
+
+    assert de is not de_de
+    assert de.ugettext("Yes") is de_de.ugettext("Yes")
+
+
+def test_clearing_cache_releases_shared_strings():
+    app = flask.Flask(__name__)
+    b = babel.Babel(app, default_locale="de_DE")
+
+    with app.test_request_context():
+        domain = b.domain_instance
+        assert gettext("Yes") == "Ja"
+    pool = domain._string_pool
+    assert "Ja" in pool
+
+    domain.cache.clear()
+    with app.test_request_context():
+        assert gettext("Yes") == "Ja"
+    assert domain._string_pool is not pool
+
+
+def test_regional_locale_falls_back_to_language():
+    app = flask.Flask(__name__)
+    app.config["BABEL_TRANSLATION_DIRECTORIES"] = "translations_variants"
+    babel.Babel(app, default_locale="de_AT")
+
+    with app.test_request_context():
+        assert gettext("January") == "Jänner"
+        assert gettext("Yes") == "Ja"
+        assert gettext("No") == "No"
+
+
+def test_known_plurals_match_gettext():
+    for expression, selector in babel._KNOWN_PLURALS.items():
+        compiled = c2py(expression)
+        for n in range(250):
+            assert selector(n) == compiled(n), (expression, n)
+
+
+def test_no_formatting_keeps_catalog_placeholders():
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de_DE")
+
+    with app.test_request_context():
+        assert gettext("Hello %(name)s!") == "Hallo %(name)s!"
+        assert gettext("Hello %(name)s!") % {"name": "Peter"} == "Hallo Peter!"
+
+
+def test_parse_matches_gettext():
+    here = os.path.dirname(__file__)
+    filenames = glob.glob(os.path.join(here, "*", "*", "LC_MESSAGES", "*.mo"))
+    assert filenames
+
+    for filename in filenames:
+        with open(filename, "rb") as fp:
+            translations = babel.CompiledTranslations(fp)
+        with open(filename, "rb") as fp:
+            expected = GNUTranslations(fp)
+
+        assert translations._catalog == expected._catalog
+        assert translations.info() == expected.info()
+        assert translations.charset() == expected.charset()
+
+
+def test_gettext_plural_message():
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de_DE")
+
+    with app.test_request_context():
+        assert gettext("%(num)s Apple") == "%(num)s Apfel"
+        assert gettext("%(num)s Apple", num=1) == "1 Apfel"
+
+
+def test_gettext_many():
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de_DE")
+    domain = babel.Domain(domain="test")
+
+    with app.test_request_context():
+        assert babel.gettext_many(("Yes", "first", "Missing")) == (
+            "Ja",
+            "first",
+            "Missing",
+        )
+        assert domain.gettext_many(["first"]) == ("erste",)
+
+
+def test_reload_translations(tmp_path):
+    here = os.path.dirname(__file__)
+    shutil.copytree(os.path.join(here, "translations", "de"), tmp_path / "de")
+
+    app = flask.Flask(__name__)
+    app.config["BABEL_TRANSLATION_DIRECTORIES"] = str(tmp_path)
+    b = babel.Babel(app, default_locale="de_DE")
+
+    with app.test_request_context():
+        assert [str(x) for x in b.list_translations()] == ["de", "de_DE"]
+        assert gettext("Yes") == "Ja"
+
+    shutil.copytree(os.path.join(here, "translations", "ja"), tmp_path / "ja")
+
+    with app.test_request_context():
+        assert [str(x) for x in b.list_translations()] == ["de", "de_DE"]
+
+        b.reload_translations()
+        assert sorted(str(x) for x in b.list_translations()) == ["de", "de_DE", "ja"]
+        assert b.domain_instance.cache == {}
+        assert gettext("Yes") == "Ja"
+
+        shutil.copy(
+            os.path.join(
+                here, "translations_variants", "de_AT", "LC_MESSAGES", "messages.mo"
+            ),
+            tmp_path / "de" / "LC_MESSAGES" / "messages.mo",
+        )
+        b.reload_translations()
+        assert gettext("Yes") == "Yes"
+        assert gettext("January") == "Jänner"
+
+
+def test_init_with_non_locale_folder(tmp_path):
+    here = os.path.dirname(__file__)
+    shutil.copytree(os.path.join(here, "translations", "de"), tmp_path / "de")
+    shutil.copytree(os.path.join(here, "translations", "de"), tmp_path / "C")
+
+    app = flask.Flask(__name__)
+    app.config["BABEL_TRANSLATION_DIRECTORIES"] = str(tmp_path)
+    babel.Babel(app, default_locale="de_DE")
+
+    with app.test_request_context():
+        assert gettext("Yes") == "Ja"
+
+
+def test_lazy_call():
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de_DE")
+    calls = []
+
+    def count_apples():
+        calls.append(None)
+        return 3
+
+    apples = lazy_ngettext(
+        "%(num)s Apple", "%(num)s Apples", babel.lazy_call(count_apples)
+    )
+    hello = lazy_gettext("Hello %(name)s!", name=babel.lazy_call(lambda: "Peter"))
+    assert calls == []
+
+    with app.test_request_context():
+        assert str(apples) == "3 Äpfel"
+        assert apples.__html__() == "3 Äpfel"
+        assert str(hello) == "Hallo Peter!"
+    assert len(calls) == 1
+
+
+def test_lazy_string_pickle():
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de_DE")
+    yes = lazy_gettext("Yes")
+
+    with app.test_request_context():
+        assert str(yes) == "Ja"
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            loaded = pickle.loads(pickle.dumps(yes, protocol))
+            assert type(loaded) is type(yes)
+            assert str(loaded) == "Ja"
+
+
+def test_lazy_string_weakref():
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de_DE")
+
+    for string in (lazy_gettext("Yes"), LazyString(str.upper, "yes")):
+        ref = weakref.ref(string)
+        assert ref() is string
+
+
+def test_lazy_string_pickle_legacy_state():
+    # LazyString(str.upper, "yes"), pickled before LazyString had __slots__.
+    legacy = [
+        b"ccopy_reg\n_reconstructor\np0\n(cflask_babel.speaklater\nLazyString\n"
+        b"p1\nc__builtin__\nobject\np2\nNtp3\nRp4\n(dp5\nV_func\np6\n"
+        b"c__builtin__\ngetattr\np7\n(c__builtin__\nunicode\np8\nVupper\np9\n"
+        b"tp10\nRp11\nsV_args\np12\n(Vyes\np13\ntp14\nsV_kwargs\np15\n(dp16\nsb.",
+        b"\x80\x02cflask_babel.speaklater\nLazyString\nq\x00)\x81q\x01}q\x02("
+        b"X\x05\x00\x00\x00_funcq\x03c__builtin__\ngetattr\nq\x04c__builtin__\n"
+        b"unicode\nq\x05X\x05\x00\x00\x00upperq\x06\x86q\x07Rq\x08X\x05\x00\x00"
+        b"\x00_argsq\tX\x03\x00\x00\x00yesq\n\x85q\x0bX\x07\x00\x00\x00_kwargsq"
+        b"\x0c}q\rub.",
+    ]
+
+    for data in legacy:
+        loaded = pickle.loads(data)
+        assert isinstance(loaded, LazyString)
+        assert str(loaded) == "YES"
+        assert loaded.lower() == "yes"
+
+
+def _three():
+    return 3
+
+
+def test_lazy_call_pickle():
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de_DE")
+    apples = lazy_ngettext("%(num)s Apple", "%(num)s Apples", babel.lazy_call(_three))
+
+    with app.test_request_context():
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            loaded = pickle.loads(pickle.dumps(apples, protocol))
+            assert str(loaded) == "3 Äpfel"
+
+    # State restored without the slot, as by code predating it.
+    legacy = LazyString.__new__(LazyString)
+    legacy._func, legacy._args, legacy._kwargs = str.upper, ("yes",), {}
+    assert str(legacy) == "YES"
+
+
+def test_lookups_do_not_reference_translations():
+    with open(
+        os.path.join(
+            os.path.dirname(__file__),
+            "translations_variants",
+            "de_AT",
+            "LC_MESSAGES",
+            "messages.mo",
+        ),
+        "rb",
+    ) as fp:
+        translations = babel.CompiledTranslations(fp)
+    translations.add_fallback(babel.CompiledTranslations())
+    assert translations.gettext("Yes") == "Yes"
+
+    for lookup in (translations.gettext, translations.ngettext):
+        cells = [cell.cell_contents for cell in lookup.__closure__ or ()]
+        assert not any(value is translations for value in cells)
+
+
+def test_translations_fallback():
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de_AT")
+
+    with app.test_request_context():
+        translations = babel.CompiledTranslations()
+        translations.add_fallback(babel.get_translations())
+        assert translations.gettext("Yes") == "Ja"
+        assert translations.ngettext("%(num)s Apple", "%(num)s Apples", 2) == (
+            "%(num)s Äpfel"
+        )
+
+
+def test_parse_file_like_adds_to_catalog():
+    here = os.path.dirname(__file__)
+    with open(
+        os.path.join(here, "translations", "de", "LC_MESSAGES", "messages.mo"), "rb"
+    ) as fp:
+        translations = babel.CompiledTranslations(fp)
+    with open(
+        os.path.join(
+            here, "translations_variants", "de_AT", "LC_MESSAGES", "messages.mo"
+        ),
+        "rb",
+    ) as fp:
+        translations._parse(io.BytesIO(fp.read()))
+
+    assert translations.gettext("January") == "Jänner"
+    assert translations.gettext("Yes") == "Ja"
+    assert translations.ngettext("%(num)s Apple", "%(num)s Apples", 2) == (
+        "%(num)s Äpfel"
+    )
+
+    with pytest.raises(OSError):
+        translations._parse(io.BytesIO(b""))